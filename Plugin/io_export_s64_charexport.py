@@ -92,6 +92,7 @@ class S64KeyFrame:
         self.pos   = None # Bone position
         self.ang   = None # Bone rotation
         self.scale = None # Bone scale
+        self.pose  = None # Index into the pose pool (if pooling is enabled)
     def __str__(self):
         string = "\t\tS64Keyframe: '"+self.bone+"'\n"
         string = string+"\t\t Pos = "+str(self.pos)+"\n"
@@ -420,7 +421,80 @@ def optimizeData(self, context, finalList, animList):
     # Return the sorted lists
     return finalList, animList
 
-def writeFile(self, object, finalList, animList):
+def poseString(self, frame):
+    string = ""
+    if (self.setting_upaxis == 'Z'):
+        string = string+(" %.4f " % (frame.pos.x*self.setting_scale))+("%.4f " % (frame.pos.y*self.setting_scale))+("%.4f" % (frame.pos.z*self.setting_scale))
+        string = string+(" %.4f " % frame.ang.w)+(" %.4f " % frame.ang.x)+("%.4f " % frame.ang.y)+("%.4f" % frame.ang.z)
+        string = string+(" %.4f " % frame.scale.x)+("%.4f " % frame.scale.y)+("%.4f" % frame.scale.z)
+    else:
+        string = string+(" %.4f " % (frame.pos.x*self.setting_scale))+("%.4f " % (frame.pos.z*self.setting_scale))+("%.4f" % (-frame.pos.y*self.setting_scale))
+        string = string+(" %.4f " % (frame.ang.w))+(" %.4f " % frame.ang.x)+("%.4f " % frame.ang.z)+("%.4f" % (-frame.ang.y))
+        string = string+(" %.4f " % frame.scale.x)+("%.4f " % frame.scale.z)+("%.4f" % frame.scale.y)
+    return string
+
+def poolPoses(self, context, animList):
+    poseList = []
+    poseDict = {}
+    poseValues = []
+    cellDict = {}
+    framecount = 0
+    tolerance = self.setting_posetolerance
+    
+    # Go through every bone of every keyframe and find its pose in the pool
+    for i in animList:
+        for f in animList[i].frames:
+            for b in animList[i].frames[f]:
+                frame = animList[i].frames[f][b]
+                framecount = framecount + 1
+                
+                # q and -q are the same rotation (and Sausage64 slerps along the shortest path), so keep w positive
+                if (frame.ang.w < 0):
+                    frame.ang = -frame.ang
+                
+                # Without a tolerance, only merge poses that export identically
+                if (tolerance == 0):
+                    key = poseString(self, frame)
+                    if (not key in poseDict):
+                        poseDict[key] = len(poseList)
+                        poseList.append(frame)
+                    frame.pose = poseDict[key]
+                    continue
+                    
+                # Otherwise, find the closest pooled pose that is within the tolerance
+                # Pooled poses are bucketed by position, so only the neighbouring cells need to be checked
+                values = (frame.pos*self.setting_scale)[:] + frame.ang[:] + frame.scale[:]
+                cell = tuple(math.floor(v/tolerance) for v in values[:3])
+                closest = None
+                closestdist = tolerance
+                for offset in itertools.product((-1, 0, 1), repeat=3):
+                    for p in cellDict.get(tuple(map(operator.add, cell, offset)), []):
+                        dist = max(abs(v1-v2) for v1, v2 in zip(values, poseValues[p]))
+                        if (dist <= closestdist):
+                            closest = p
+                            closestdist = dist
+                            
+                # If no pose was close enough, add this one to the pool
+                if (closest is None):
+                    closest = len(poseList)
+                    poseList.append(frame)
+                    poseValues.append(values)
+                    cellDict.setdefault(cell, []).append(closest)
+                frame.pose = closest
+    
+    # Report the number of duplicates
+    if (framecount > 0):
+        self.report({'INFO'}, "Pose pool: %d unique poses for %d keyframe entries (%d duplicate poses)." % (len(poseList), framecount, framecount-len(poseList)))
+    
+    # Print the pose pool for debugging purposes
+    if (DebugS64Export):
+        for i, p in enumerate(poseList):
+            print("Pose "+str(i)+":\n"+str(p))
+    
+    # Return the pose pool
+    return poseList
+
+def writeFile(self, object, finalList, animList, poseList=None):
     with open(self.filepath, 'w') as file:
         file.write("/**********************************\n")
         file.write("      Sausage64 Character Mesh\n")
@@ -469,6 +543,13 @@ def writeFile(self, object, finalList, animList):
             # End this mesh
             file.write("END MESH "+validstring(n)+"\n\n")
             
+        # Write the pose pool
+        if (poseList):
+            file.write("BEGIN POSES\n")
+            for p in poseList:
+                file.write(poseString(self, p)[1:]+"\n")
+            file.write("END POSES\n\n")
+            
         # Write the animation data
         for n, a in animList.items():
         
@@ -481,14 +562,10 @@ def writeFile(self, object, finalList, animList):
                 for b in a.frames[kf]:
                     frame = a.frames[kf][b]
                     file.write(validstring(frame.bone))
-                    if (self.setting_upaxis == 'Z'):
-                        file.write((" %.4f " % (frame.pos.x*self.setting_scale))+("%.4f " % (frame.pos.y*self.setting_scale))+("%.4f" % (frame.pos.z*self.setting_scale)))
-                        file.write((" %.4f " % frame.ang.w)+(" %.4f " % frame.ang.x)+("%.4f " % frame.ang.y)+("%.4f" % frame.ang.z))
-                        file.write((" %.4f " % frame.scale.x)+("%.4f " % frame.scale.y)+("%.4f\n" % frame.scale.z))
+                    if (poseList):
+                        file.write(" POSE "+str(frame.pose)+"\n")
                     else:
-                        file.write((" %.4f " % (frame.pos.x*self.setting_scale))+("%.4f " % (frame.pos.z*self.setting_scale))+("%.4f" % (-frame.pos.y*self.setting_scale)))
-                        file.write((" %.4f " % (frame.ang.w))+(" %.4f " % frame.ang.x)+("%.4f " % frame.ang.z)+("%.4f" % (-frame.ang.y)))
-                        file.write((" %.4f " % frame.scale.x)+("%.4f " % frame.scale.z)+("%.4f\n" % frame.scale.y))
+                        file.write(poseString(self, frame)+"\n")
                 file.write("END KEYFRAME "+str(int(kf))+"\n")
                 
             file.write("END ANIMATION "+validstring(n)+"\n\n")
@@ -528,6 +605,8 @@ class ObjectExport(bpy.types.Operator):
     setting_animfps      = bpy.props.FloatProperty(name="Animation FPS", description="By default, Sausage64 assumes animations are 30FPS. Changing this value will scale the animation to match this framerate.", min=0.0, max=1000.0, default=30.0)
     setting_scale        = bpy.props.FloatProperty(name="Export Scale", description="The size of the exported model", min=0.0, max=1000.0, default=1.0)
     setting_upaxis       = bpy.props.EnumProperty(name="Up Axis", description="The selected axis points upward", items=(('Z', "Z", "The Z axis points up"), ('Y', "Y", "The Y axis points up")), default='Z')
+    setting_posepool     = bpy.props.BoolProperty(name="Pool poses", description="Store each unique bone pose once and have keyframes refer to it by index.", default=False)
+    setting_posetolerance = bpy.props.FloatProperty(name="Pose Tolerance", description="When pooling, a pose reuses a pooled pose if none of their values differ by more than this amount. Zero only merges poses that export identically.", min=0.0, max=1.0, default=0.0, precision=4)
     filepath             = bpy.props.StringProperty(subtype='FILE_PATH')    
 
     # If we are running on Blender 2.9.3 or newer, it will expect the new "annotation"
@@ -541,6 +620,8 @@ class ObjectExport(bpy.types.Operator):
                            "setting_animfps" : setting_animfps,
                            "setting_scale" : setting_scale,
                            "setting_upaxis" : setting_upaxis,
+                           "setting_posepool" : setting_posepool,
+                           "setting_posetolerance" : setting_posetolerance,
                            "filepath" : filepath}
     
     def execute(self, context):
@@ -616,8 +697,13 @@ class ObjectExport(bpy.types.Operator):
         # Optimize the data further
         finalList, animList = optimizeData(self, context, finalList, animList)
         
+        # Deduplicate the keyframe poses if requested
+        poseList = None
+        if (self.setting_posepool):
+            poseList = poolPoses(self, context, animList)
+        
         # Finally, dump all the organized data to a file
-        writeFile(self, context, finalList, animList);
+        writeFile(self, context, finalList, animList, poseList);
         return {'FINISHED'}
 
     def invoke(self, context, event):
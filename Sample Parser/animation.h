@@ -14,9 +14,11 @@
     } s64FrameData;
     
     // Keyframe struct
-    typedef struct {
+    typedef struct s64Keyframe_t {
         unsigned int keyframe;
         linkedList framedata;
+        struct s64Keyframe_t* shared; // Keyframe whose framedata this one reuses
+        char* sharedanim;             // Name of the animation that keyframe belongs to
     } s64Keyframe;
 
     // Animation struct
@@ -39,6 +39,7 @@ bool global_binaryout = FALSE;
 bool global_initialload = TRUE;
 bool global_no2tri = FALSE;
 bool global_opengl = FALSE;
+bool global_sharekeyframes = FALSE;
 char* global_outputname = "outdlist.h";
 char* global_modelname = "MyModel";
 unsigned int global_cachesize = 32;
@@ -77,6 +78,7 @@ int main(int argc, char* argv[])
             "\t-o <File>\t(optional) Output filename (default 'outdlist.h')\n"
             "\t-q \t\t(optional) Quiet mode\n"
             "\t-r \t\t(optional) Don't add root to coordinates/translations\n"
+            "\t-s \t\t(optional) Share framedata between identical keyframes\n"
         );
      
     // Parse the command line arguments
@@ -178,6 +180,9 @@ static void parse_programargs(int argc, char* argv[])
                 case 'q':
                     global_quiet = !global_quiet;
                     break;
+                case 's':
+                    global_sharekeyframes = !global_sharekeyframes;
+                    break;
                 case 'b':
                     global_binaryout = !global_binaryout;
                     break;
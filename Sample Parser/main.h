@@ -26,6 +26,7 @@
     extern bool global_initialload;
     extern bool global_no2tri;
     extern bool global_opengl;
+    extern bool global_sharekeyframes;
     extern char* global_outputname;
     extern char* global_modelname;
     extern unsigned int global_cachesize;
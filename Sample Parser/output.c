@@ -14,6 +14,84 @@ Outputs the parsed data to a file
 
 #define STRBUF_SIZE 512
 
+/*==============================
+    framedata_equals
+    Checks if two keyframes have the exact same framedata
+    @param The first keyframe
+    @param The second keyframe
+    @returns Whether both keyframes pose every mesh identically
+==============================*/
+
+static bool framedata_equals(s64Keyframe* a, s64Keyframe* b)
+{
+    listNode* anode;
+    listNode* bnode;
+    if (a->framedata.size != b->framedata.size)
+        return FALSE;
+        
+    // The parser sorts every keyframe's framedata by mesh, so we can compare them in order
+    for (anode = a->framedata.head, bnode = b->framedata.head; anode != NULL; anode = anode->next, bnode = bnode->next)
+    {
+        s64FrameData* afdata = (s64FrameData*)anode->data;
+        s64FrameData* bfdata = (s64FrameData*)bnode->data;
+        if (afdata->mesh != bfdata->mesh
+            || memcmp(&afdata->translation, &bfdata->translation, sizeof(Vector3D)) != 0
+            || memcmp(&afdata->rotation, &bfdata->rotation, sizeof(Vector4D)) != 0
+            || memcmp(&afdata->scale, &bfdata->scale, sizeof(Vector3D)) != 0)
+            return FALSE;
+    }
+    return TRUE;
+}
+
+
+/*==============================
+    share_keyframes
+    Finds keyframes with the same framedata as an earlier keyframe
+    (in any animation), so that they can reuse its framedata array
+    @returns The number of keyframes that were shared
+==============================*/
+
+static int share_keyframes()
+{
+    int sharedcount = 0;
+    listNode* animnode;
+    linkedList uniques = EMPTY_LINKEDLIST;
+    
+    // Compare each keyframe against the keyframes that have their own framedata
+    for (animnode = list_animations.head; animnode != NULL; animnode = animnode->next)
+    {
+        listNode* keyfnode;
+        s64Anim* anim = (s64Anim*)animnode->data;
+        for (keyfnode = anim->keyframes.head; keyfnode != NULL; keyfnode = keyfnode->next)
+        {
+            listNode* uniquenode;
+            s64Keyframe* keyf = (s64Keyframe*)keyfnode->data;
+            for (uniquenode = uniques.head; uniquenode != NULL; uniquenode = uniquenode->next)
+            {
+                s64Keyframe* unique = (s64Keyframe*)uniquenode->data;
+                if (framedata_equals(unique, keyf))
+                {
+                    keyf->shared = unique->shared;
+                    keyf->sharedanim = unique->sharedanim;
+                    sharedcount++;
+                    break;
+                }
+            }
+            
+            // If no match was found, this keyframe keeps its own framedata
+            if (uniquenode == NULL)
+            {
+                keyf->shared = keyf;
+                keyf->sharedanim = anim->name;
+                list_append(&uniques, keyf);
+            }
+        }
+    }
+    list_destroy(&uniques);
+    return sharedcount;
+}
+
+
 /*==============================
     write_output_text
     Writes the output to a text file
@@ -103,6 +181,13 @@ void write_output_text()
     // Write the animation data
     if (list_animations.size > 0)
     {
+        // Find the keyframes that can share their framedata
+        if (global_sharekeyframes)
+        {
+            int sharedcount = share_keyframes();
+            if (!global_quiet) printf("Shared framedata of %d keyframes\n", sharedcount);
+        }
+        
         fputs("\n", fp);
         fputs("/*********************************\n"
               "          Animation Data\n"
@@ -118,6 +203,10 @@ void write_output_text()
             {
                 listNode* meshnode;
                 s64Keyframe* keyf = (s64Keyframe*)keyfnode->data;
+                
+                // Skip this keyframe if it reuses the framedata of another
+                if (keyf->shared != NULL && keyf->shared != keyf)
+                    continue;
                 fprintf(fp, "static s64FrameData anim_%s_%s_framedata%d[] = {\n", global_modelname, anim->name, keyf->keyframe);
                 for (meshnode = list_meshes.head; meshnode != NULL; meshnode = meshnode->next) // Iterating meshes because they can be out of order to the frame data, due to texture sorting optimization
                 {
@@ -144,7 +233,10 @@ void write_output_text()
             for (keyfnode = anim->keyframes.head; keyfnode != NULL; keyfnode = keyfnode->next)
             {
                 s64Keyframe* keyf = (s64Keyframe*)keyfnode->data;
-                fprintf(fp, "    {%d, anim_%s_%s_framedata%d},\n", keyf->keyframe, global_modelname, anim->name, keyf->keyframe);
+                if (keyf->shared != NULL)
+                    fprintf(fp, "    {%d, anim_%s_%s_framedata%d},\n", keyf->keyframe, global_modelname, keyf->sharedanim, keyf->shared->keyframe);
+                else
+                    fprintf(fp, "    {%d, anim_%s_%s_framedata%d},\n", keyf->keyframe, global_modelname, anim->name, keyf->keyframe);
             }
             fprintf(fp, "};");
         }
@@ -33,6 +33,9 @@ generated exactly from Blender, that's not a big deal.
 static lexState lexer_curstate = STATE_NONE;
 static lexState lexer_prevstate = STATE_NONE;
 
+// Pose pool
+static hashTable parser_poses;
+
 
 /*==============================
     lexer_changestate
@@ -60,6 +63,29 @@ static inline void lexer_restorestate()
 }
 
 
+/*==============================
+    parse_framedata
+    Reads the translation, rotation and scale of a framedata
+    from the current string being tokenized
+    @param The framedata to fill in
+    @param The first substring of the data
+==============================*/
+
+static void parse_framedata(s64FrameData* fdata, char* strdata)
+{
+    fdata->translation.x = atof(strdata);
+    fdata->translation.y = atof(strtok(NULL, " "));
+    fdata->translation.z = atof(strtok(NULL, " "));
+    fdata->rotation.w = atof(strtok(NULL, " "));
+    fdata->rotation.x = atof(strtok(NULL, " "));
+    fdata->rotation.y = atof(strtok(NULL, " "));
+    fdata->rotation.z = atof(strtok(NULL, " "));
+    fdata->scale.x = atof(strtok(NULL, " "));
+    fdata->scale.y = atof(strtok(NULL, " "));
+    fdata->scale.z = atof(strtok(NULL, " "));
+}
+
+
 /*==============================
     parse_sausage
     Parses a sausage64 model file
@@ -77,6 +103,8 @@ void parse_sausage(FILE* fp)
     s64Anim* curanim;
     s64Keyframe* curkeyframe;
     s64FrameData* curframedata;
+    s64FrameData* curpose;
+    dictNode* posenode;
     n64Texture* curtex;
     Vector3D tempvec;
     
@@ -139,6 +167,7 @@ void parse_sausage(FILE* fp)
                         }
                         break;
                     case STATE_NONE:
+                        strdata[strcspn(strdata, "\r\n")] = 0;
                         if (!strcmp(strdata, "MESH"))
                         {
                             lexer_changestate(STATE_MESH);
@@ -163,6 +192,8 @@ void parse_sausage(FILE* fp)
                             curanim = add_animation(strdata);
                             if (!global_quiet) printf("    Created new animation '%s'\n", strdata);
                         }
+                        else if (!strcmp(strdata, "POSES"))
+                            lexer_changestate(STATE_POSES);
                         break;
                 }
             }
@@ -259,16 +290,28 @@ void parse_sausage(FILE* fp)
                     case STATE_KEYFRAME:
                         curframedata = add_framedata(curkeyframe);
                         curframedata->mesh = find_mesh(strdata);
-                        curframedata->translation.x = atof(strtok(NULL, " "));
-                        curframedata->translation.y = atof(strtok(NULL, " "));
-                        curframedata->translation.z = atof(strtok(NULL, " "));
-                        curframedata->rotation.w = atof(strtok(NULL, " "));
-                        curframedata->rotation.x = atof(strtok(NULL, " "));
-                        curframedata->rotation.y = atof(strtok(NULL, " "));
-                        curframedata->rotation.z = atof(strtok(NULL, " "));
-                        curframedata->scale.x = atof(strtok(NULL, " "));
-                        curframedata->scale.y = atof(strtok(NULL, " "));
-                        curframedata->scale.z = atof(strtok(NULL, " "));
+                        strdata = strtok(NULL, " ");
+                        
+                        // Handle keyframes that refer to the pose pool
+                        if (!strcmp(strdata, "POSE"))
+                        {
+                            posenode = htable_getkey(&parser_poses, atoi(strtok(NULL, " ")));
+                            if (posenode == NULL)
+                                terminate("Error: Keyframe refers to a pose that does not exist\n");
+                            curpose = (s64FrameData*)posenode->value;
+                            curframedata->translation = curpose->translation;
+                            curframedata->rotation = curpose->rotation;
+                            curframedata->scale = curpose->scale;
+                        }
+                        else
+                            parse_framedata(curframedata, strdata);
+                        break;
+                    case STATE_POSES:
+                        curpose = (s64FrameData*)calloc(1, sizeof(s64FrameData));
+                        if (curpose == NULL)
+                            terminate("Error: Unable to allocate memory for animation pose\n");
+                        parse_framedata(curpose, strdata);
+                        htable_append(&parser_poses, parser_poses.size, curpose);
                         break;
                 }
             }
@@ -280,6 +323,10 @@ void parse_sausage(FILE* fp)
     if (!global_quiet) printf("Finished parsing s64 model\n    Mesh count: %d\n    Animation count: %d\n    Texture count: %d\n", list_meshes.size, list_animations.size, list_textures.size);
     fclose(fp);
     
+    // The pose pool has been copied into the keyframes, so it is no longer needed
+    if (!global_quiet && parser_poses.size > 0) printf("    Pose count: %d\n", parser_poses.size);
+    htable_destroy_deep(&parser_poses);
+    
     // Sort the framedata by the order the meshes are in (Note: horrible time complexity as this is a bodge solution)
     for (curnode = list_animations.head; curnode != NULL; curnode = curnode->next)
     {
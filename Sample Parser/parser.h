@@ -13,7 +13,8 @@
         STATE_VERTICES,
         STATE_FACES,
         STATE_ANIMATION,
-        STATE_KEYFRAME
+        STATE_KEYFRAME,
+        STATE_POSES
     } lexState;
     
     
@@ -67,6 +67,8 @@ bool s64Model::GenerateFromFile(std::string path)
     s64Anim* curanim = NULL;
     s64Keyframe* curkeyframe = NULL;
     s64FrameData* curframedata = NULL;
+    s64FrameData curpose;
+    std::vector<s64FrameData> poses;
     n64Texture* curtex = NULL;
     std::list<s64Vert*>::iterator vertit;
     FILE* fp = fopen(path.c_str(), "r+");
@@ -135,6 +137,7 @@ bool s64Model::GenerateFromFile(std::string path)
                         }
                         break;
                     case STATE_NONE:
+                        strdata[strcspn(strdata, "\r\n")] = 0;
                         if (!strcmp(strdata, "MESH"))
                         {
                             this->m_lexer_statestack.push(STATE_MESH);
@@ -161,6 +164,10 @@ bool s64Model::GenerateFromFile(std::string path)
                             curanim->name = strdata;
                             this->m_anims.push_back(curanim);
                         }
+                        else if (!strcmp(strdata, "POSES"))
+                        {
+                            this->m_lexer_statestack.push(STATE_POSES);
+                        }
                         break;
                 }
             }
@@ -269,7 +276,23 @@ bool s64Model::GenerateFromFile(std::string path)
                                 break;
                             }
                         }
-                        curframedata->translation.x = (float)atof(strtok(NULL, " "));
+                        strdata = strtok(NULL, " ");
+
+                        // Handle keyframes that refer to the pose pool
+                        if (!strcmp(strdata, "POSE"))
+                        {
+                            unsigned int poseindex = atoi(strtok(NULL, " "));
+                            if (poseindex >= poses.size())
+                            {
+                                fclose(fp);
+                                return false;
+                            }
+                            curframedata->translation = poses[poseindex].translation;
+                            curframedata->rotation = poses[poseindex].rotation;
+                            curframedata->scale = poses[poseindex].scale;
+                            break;
+                        }
+                        curframedata->translation.x = (float)atof(strdata);
                         curframedata->translation.y = (float)atof(strtok(NULL, " "));
                         curframedata->translation.z = (float)atof(strtok(NULL, " "));
                         curframedata->rotation.w = (float)atof(strtok(NULL, " "));
@@ -280,6 +303,19 @@ bool s64Model::GenerateFromFile(std::string path)
                         curframedata->scale.y = (float)atof(strtok(NULL, " "));
                         curframedata->scale.z = (float)atof(strtok(NULL, " "));
                         break;
+                    case STATE_POSES:
+                        curpose.translation.x = (float)atof(strdata);
+                        curpose.translation.y = (float)atof(strtok(NULL, " "));
+                        curpose.translation.z = (float)atof(strtok(NULL, " "));
+                        curpose.rotation.w = (float)atof(strtok(NULL, " "));
+                        curpose.rotation.x = (float)atof(strtok(NULL, " "));
+                        curpose.rotation.y = (float)atof(strtok(NULL, " "));
+                        curpose.rotation.z = (float)atof(strtok(NULL, " "));
+                        curpose.scale.x = (float)atof(strtok(NULL, " "));
+                        curpose.scale.y = (float)atof(strtok(NULL, " "));
+                        curpose.scale.z = (float)atof(strtok(NULL, " "));
+                        poses.push_back(curpose);
+                        break;
                 }
             }
 
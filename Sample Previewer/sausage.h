@@ -5,6 +5,7 @@ typedef struct IUnknown IUnknown;
 #include <string>
 #include <list>
 #include <stack>
+#include <vector>
 #include "Include/glm/glm/glm.hpp"
 #include "sausage_texture.h"
 #include "sausage_mesh.h"
@@ -22,7 +23,8 @@ typedef enum {
     STATE_VERTICES,
     STATE_FACES,
     STATE_ANIMATION,
-    STATE_KEYFRAME
+    STATE_KEYFRAME,
+    STATE_POSES
 } lexState;
 
 